@@ -1,7 +1,10 @@
 import dash
 from dash import dcc, html, Input, Output, State
 import dash_bootstrap_components as dbc
+from flask_compress import Compress
 import math
+import sys
+import numpy as np
 
 # --- CONSTANTS ---
 # NEC Table 310.15(B)(16) (Copper)
@@ -42,12 +45,31 @@ NEC_DIAMETERS_XHHW2 = {
     '800': 1.191, '900': 1.251, '1000': 1.317
 }
 
-WIRE_SIZES = list(NEC_TABLE_COPPER.keys())
-TEMP_RATINGS = ['60', '75', '90']
+# Cross-sectional areas (in²) for the diameters above, computed once at import
+NEC_AREAS_XHHW2 = {k: math.pi * 0.25 * d * d for k, d in NEC_DIAMETERS_XHHW2.items()}
+
+WIRE_SIZES = tuple(sys.intern(s) for s in (
+    '14', '12', '10', '8', '6', '4', '3', '2', '1',
+    '1/0', '2/0', '3/0', '4/0',
+    '250', '300', '350', '400', '500', '600', '700', '750',
+    '800', '900', '1000',
+))
+TEMP_RATINGS = [sys.intern(s) for s in ('60', '75', '90')]
+
+# Dropdown options, shared by the phase and ground selects
+_WIRE_OPTS = [{'label': s, 'value': s} for s in WIRE_SIZES]
+_TEMP_OPTS = [{'label': f"{t}°C", 'value': t} for t in TEMP_RATINGS]
+
+# Dense lookup tables indexed by [size] / [size, temp]
+_SIZE_IDX = {s: i for i, s in enumerate(WIRE_SIZES)}
+_TEMP_IDX = {'60': 0, '75': 1, '90': 2}
+_AMPACITY = np.array([[NEC_TABLE_COPPER[s][t] for t in TEMP_RATINGS] for s in WIRE_SIZES], dtype=np.float32)
+_DIAM = np.array([NEC_DIAMETERS_XHHW2[s] for s in WIRE_SIZES], dtype=np.float64)
 
 # --- APP INIT ---
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.SPACELAB])
 server=app.server
+Compress(server)
 app.title = "Electrical Load & Wireway Sizing"
 
 # --- HELPER COMPONENTS ---
@@ -61,7 +83,7 @@ def make_input_group(label, id_name, value, unit=None, note=None):
     return html.Div([
         dbc.Label(label, html_for=id_name, className="fw-bold text-muted small text-uppercase mb-1"),
         dbc.InputGroup([
-            dbc.Input(id=id_name, type="number", value=value, step=0.001),
+            dbc.Input(id=id_name, type="number", value=value, step=0.001, debounce=True),
             dbc.InputGroupText(unit) if unit else None
         ], size="sm"),
         html.Small(note, className="text-muted mt-1 d-block") if note else None
@@ -83,10 +105,19 @@ app.layout = dbc.Container([
 
     # Status Banners
     dbc.Row([
-        dbc.Col(id="ampacity-status-col", width=12, md=6),
-        dbc.Col(id="fill-status-col", width=12, md=6),
+        dbc.Col(dbc.Alert([
+            html.H5(id="ampacity-status-heading", className="alert-heading"),
+            html.P(id="ampacity-status-text")
+        ], id="ampacity-status-alert"), id="ampacity-status-col", width=12, md=6),
+        dbc.Col(dbc.Alert([
+            html.H5(id="fill-status-heading", className="alert-heading"),
+            html.P(id="fill-status-text")
+        ], id="fill-status-alert"), id="fill-status-col", width=12, md=6),
     ], className="mb-4"),
 
+    # Conductor tables for the clientside fill calculation
+    dcc.Store(id="store-xhhw2", data={"diam": NEC_DIAMETERS_XHHW2, "area": NEC_AREAS_XHHW2}),
+
     # Main Grid
     dbc.Row([
         # Left Column: Inputs
@@ -111,11 +142,11 @@ app.layout = dbc.Container([
                     dbc.Row([
                         dbc.Col([
                             dbc.Label("Size (AWG/kcmil)", className="small fw-bold text-muted"),
-                            dbc.Select(id="select-phase-size", options=[{'label': s, 'value': s} for s in WIRE_SIZES], value='750', size="sm")
+                            dbc.Select(id="select-phase-size", options=_WIRE_OPTS, value='750', size="sm")
                         ], md=4),
                         dbc.Col([
                             dbc.Label("Temp Rating", className="small fw-bold text-muted"),
-                            dbc.Select(id="select-temp-rating", options=[{'label': f"{t}°C", 'value': t} for t in TEMP_RATINGS], value='90', size="sm")
+                            dbc.Select(id="select-temp-rating", options=_TEMP_OPTS, value='90', size="sm")
                         ], md=4),
                         dbc.Col(make_input_group("Base Ampacity", "input-cable-ampacity", 535, "A"), md=4),
                     ]),
@@ -123,7 +154,7 @@ app.layout = dbc.Container([
                         # Hidden calculation/display for phase diameter, logic handles it in callback
                          dbc.Label("Phase Diameter (Auto)", className="small fw-bold text-muted mt-2"),
                          dbc.InputGroup([
-                             dbc.Input(id="input-phase-diam", type="number", value=1.156, step=0.001),
+                             dbc.Input(id="input-phase-diam", type="number", value=1.156, step=0.001, debounce=True),
                              dbc.InputGroupText("in")
                          ], size="sm")
                     ])
@@ -135,12 +166,12 @@ app.layout = dbc.Container([
                     dbc.Row([
                         dbc.Col([
                             dbc.Label("Size (AWG/kcmil)", className="small fw-bold text-muted"),
-                            dbc.Select(id="select-ground-size", options=[{'label': s, 'value': s} for s in WIRE_SIZES], value='500', size="sm")
+                            dbc.Select(id="select-ground-size", options=_WIRE_OPTS, value='500', size="sm")
                         ], md=6),
                          dbc.Col([
                              dbc.Label("Ground Diameter", className="small fw-bold text-muted"),
                              dbc.InputGroup([
-                                 dbc.Input(id="input-ground-diam", type="number", value=0.949, step=0.001),
+                                 dbc.Input(id="input-ground-diam", type="number", value=0.949, step=0.001, debounce=True),
                                  dbc.InputGroupText("in")
                              ], size="sm")
                          ], md=6),
@@ -208,25 +239,21 @@ app.layout = dbc.Container([
     [Input("select-phase-size", "value"),
      Input("select-temp-rating", "value")],
     [State("input-cable-ampacity", "value"),
-     State("input-phase-diam", "value")]
+     State("input-phase-diam", "value")],
+    prevent_initial_call=True
 )
 def update_phase_specs(size, temp, current_amp, current_diam):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return current_amp, current_diam
-    
     # Defaults
     new_amp = current_amp
     new_diam = current_diam
 
-    # Lookup Ampacity
-    if size in NEC_TABLE_COPPER and temp in NEC_TABLE_COPPER[size]:
-        new_amp = NEC_TABLE_COPPER[size][temp]
-    
-    # Lookup Diameter
-    if size in NEC_DIAMETERS_XHHW2:
-        new_diam = NEC_DIAMETERS_XHHW2[size]
-        
+    # Lookup Ampacity & Diameter
+    if size in _SIZE_IDX:
+        i = _SIZE_IDX[size]
+        new_diam = float(_DIAM[i])
+        if temp in _TEMP_IDX:
+            new_amp = float(_AMPACITY[i, _TEMP_IDX[temp]])
+
     return new_amp, new_diam
 
 # 2. Update Ground Diameter based on Dropdown
@@ -236,19 +263,129 @@ def update_phase_specs(size, temp, current_amp, current_diam):
     State("input-ground-diam", "value")
 )
 def update_ground_specs(size, current_diam):
-    if size in NEC_DIAMETERS_XHHW2:
-        return NEC_DIAMETERS_XHHW2[size]
+    if size in _SIZE_IDX:
+        return float(_DIAM[_SIZE_IDX[size]])
     return current_diam
 
-# 3. Main Calculation & UI Updates
-@app.callback(
+# 3. Ampacity Calculation & UI Updates (runs in the browser)
+app.clientside_callback(
+    """
+    function(fla, ocpd, parallel, temp_corr, base_ampacity, prev_status) {
+        const no_update = window.dash_clientside.no_update;
+
+        // Safety checks for None/Zero
+        if (!(fla && ocpd && parallel && base_ampacity)) {
+            return Array(7).fill("---");
+        }
+
+        // --- Calculations ---
+        const calculated_ampacity = base_ampacity * parallel * temp_corr;
+        const is_ampacity_safe = calculated_ampacity > ocpd;
+
+        // --- UI Formatting ---
+        const amp_color_class = is_ampacity_safe
+            ? "display-4 fw-bold text-center my-3 text-success"
+            : "display-4 fw-bold text-center my-3 text-danger";
+        const amp_card_class = is_ampacity_safe
+            ? "mb-4 shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 border-success"
+            : "mb-4 shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 border-danger";
+        const amp_calc_text = `Base (${base_ampacity}A) × Parallel (${parallel}) × Corr (${temp_corr})`;
+
+        // Status Banner: only re-render color/heading when pass/fail flips
+        const amp_status = is_ampacity_safe ? "success" : "danger";
+        const amp_status_changed = amp_status !== prev_status;
+
+        return [
+            `${calculated_ampacity.toFixed(1)} A`,
+            amp_color_class,
+            amp_calc_text,
+            amp_card_class,
+
+            amp_status_changed ? amp_status : no_update,
+            amp_status_changed ? (is_ampacity_safe ? "Ampacity Check: PASS" : "Ampacity Check: FAIL") : no_update,
+            `Calculated (${calculated_ampacity.toFixed(1)} A) > OCPD (${ocpd} A)`
+        ];
+    }
+    """,
     [
         # Results
         Output("result-ampacity-display", "children"),
         Output("result-ampacity-display", "className"),
         Output("result-ampacity-calc-text", "children"),
         Output("card-ampacity-result", "className"), # For border color
-        
+
+        # Status Banner
+        Output("ampacity-status-alert", "color"),
+        Output("ampacity-status-heading", "children"),
+        Output("ampacity-status-text", "children"),
+    ],
+    [
+        Input("input-fla", "value"),
+        Input("input-ocpd", "value"),
+        Input("input-parallel", "value"),
+        Input("input-temp-correction", "value"),
+        Input("input-cable-ampacity", "value"),
+    ],
+    State("ampacity-status-alert", "color")
+)
+
+# 4. Wireway Fill Calculation & UI Updates (runs in the browser)
+app.clientside_callback(
+    """
+    function(parallel, num_wireways, phase_diam, ground_diam, ground_qty, wireway_area,
+             phase_size, ground_size, xhhw2, prev_status) {
+        const PI = Math.PI;
+        const no_update = window.dash_clientside.no_update;
+
+        // Safety checks for None/Zero
+        if (!(parallel && num_wireways && phase_diam && ground_diam && wireway_area)) {
+            return Array(9).fill("---");
+        }
+
+        // Use the precomputed table area unless the diameter was overridden by hand
+        const conductor_area = (size, diam) =>
+            xhhw2.diam[size] === diam ? xhhw2.area[size] : PI * 0.25 * diam * diam;
+
+        // --- Calculations ---
+        const conductors_in_raceway = (parallel / num_wireways) * 3;
+        const phase_area = conductor_area(phase_size, phase_diam);
+        const ground_area = conductor_area(ground_size, ground_diam);
+
+        const total_phase_area = conductors_in_raceway * phase_area;
+        const total_ground_area = ground_qty * ground_area;
+        const total_fill_area = total_phase_area + total_ground_area;
+
+        const fill_percentage = (total_fill_area / wireway_area) * 100;
+        const is_fill_safe = fill_percentage <= 20;
+
+        // --- UI Formatting ---
+        const fill_color_class = is_fill_safe
+            ? "display-4 fw-bold text-center my-2 text-success"
+            : "display-4 fw-bold text-center my-2 text-danger";
+        const fill_card_class = is_fill_safe
+            ? "shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 border-success"
+            : "shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 border-danger";
+
+        // Status Banner: only re-render color/heading when pass/fail flips
+        const fill_status = is_fill_safe ? "success" : "danger";
+        const fill_status_changed = fill_status !== prev_status;
+
+        return [
+            `${total_phase_area.toFixed(2)} in²`,
+            `${total_ground_area.toFixed(2)} in²`,
+            `${total_fill_area.toFixed(2)} in²`,
+            `${fill_percentage.toFixed(1)}%`,
+            fill_color_class,
+            fill_card_class,
+
+            fill_status_changed ? fill_status : no_update,
+            fill_status_changed ? (is_fill_safe ? "Wireway Fill: PASS" : "Wireway Fill: FAIL") : no_update,
+            `Fill (${fill_percentage.toFixed(1)}%) is ${is_fill_safe ? "within" : "exceeds"} 20% limit`
+        ];
+    }
+    """,
+    [
+        # Results
         Output("display-phase-area", "children"),
         Output("display-ground-area", "children"),
         Output("display-total-fill", "children"),
@@ -256,90 +393,28 @@ def update_ground_specs(size, current_diam):
         Output("result-fill-display", "className"),
         Output("card-fill-result", "className"), # For border color
 
-        # Status Banners
-        Output("ampacity-status-col", "children"),
-        Output("fill-status-col", "children"),
+        # Status Banner
+        Output("fill-status-alert", "color"),
+        Output("fill-status-heading", "children"),
+        Output("fill-status-text", "children"),
     ],
     [
-        Input("input-fla", "value"),
-        Input("input-ocpd", "value"),
         Input("input-parallel", "value"),
         Input("input-wireways", "value"),
-        Input("input-temp-correction", "value"),
-        Input("input-cable-ampacity", "value"),
         Input("input-phase-diam", "value"),
         Input("input-ground-diam", "value"),
         Input("input-ground-qty", "value"),
         Input("input-wireway-area", "value"),
+    ],
+    [
+        State("select-phase-size", "value"),
+        State("select-ground-size", "value"),
+        State("store-xhhw2", "data"),
+        State("fill-status-alert", "color"),
     ]
 )
-def calculate_all(fla, ocpd, parallel, num_wireways, temp_corr, 
-                  base_ampacity, phase_diam, ground_diam, ground_qty, wireway_area):
-    
-    # Safety checks for None/Zero
-    if not all([fla, ocpd, parallel, num_wireways, base_ampacity, phase_diam, ground_diam, wireway_area]):
-        return ["---"] * 11
-
-    # --- Calculations ---
-    
-    # 1. Ampacity
-    calculated_ampacity = base_ampacity * parallel * temp_corr
-    is_ampacity_safe = calculated_ampacity > ocpd
-    
-    # 2. Fill
-    conductors_in_raceway = (parallel / num_wireways) * 3
-    phase_area = math.pi * ((phase_diam/2)**2)
-    ground_area = math.pi * ((ground_diam/2)**2)
-    
-    total_phase_area = conductors_in_raceway * phase_area
-    total_ground_area = ground_qty * ground_area
-    total_fill_area = total_phase_area + total_ground_area
-    
-    fill_percentage = (total_fill_area / wireway_area) * 100
-    is_fill_safe = fill_percentage <= 20
-
-    # --- UI Formatting ---
 
-    # Ampacity Styles
-    amp_color_class = "text-success" if is_ampacity_safe else "text-danger"
-    amp_card_class = f"mb-4 shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 {'border-success' if is_ampacity_safe else 'border-danger'}"
-    amp_calc_text = f"Base ({base_ampacity}A) × Parallel ({parallel}) × Corr ({temp_corr})"
-    
-    # Fill Styles
-    fill_color_class = "text-success" if is_fill_safe else "text-danger"
-    fill_card_class = f"shadow-sm border-top-0 border-end-0 border-bottom-0 border-start-4 {'border-success' if is_fill_safe else 'border-danger'}"
-
-    # Status Banners
-    amp_banner = dbc.Alert(
-        [html.H5("Ampacity Check: PASS" if is_ampacity_safe else "Ampacity Check: FAIL", className="alert-heading"),
-         html.P(f"Calculated ({calculated_ampacity:.1f} A) > OCPD ({ocpd} A)")],
-        color="success" if is_ampacity_safe else "danger"
-    )
-
-    fill_banner = dbc.Alert(
-        [html.H5("Wireway Fill: PASS" if is_fill_safe else "Wireway Fill: FAIL", className="alert-heading"),
-         html.P(f"Fill ({fill_percentage:.1f}%) is {'within' if is_fill_safe else 'exceeds'} 20% limit")],
-        color="success" if is_fill_safe else "danger"
-    )
-
-    return (
-        f"{calculated_ampacity:.1f} A",
-        f"display-4 fw-bold text-center my-3 {amp_color_class}",
-        amp_calc_text,
-        amp_card_class,
-        
-        f"{total_phase_area:.2f} in²",
-        f"{total_ground_area:.2f} in²",
-        f"{total_fill_area:.2f} in²",
-        f"{fill_percentage:.1f}%",
-        f"display-4 fw-bold text-center my-2 {fill_color_class}",
-        fill_card_class,
-
-        amp_banner,
-        fill_banner
-    )
-
-# 4. Clientside Callback for Print
+# 5. Clientside Callback for Print
 app.clientside_callback(
     """
     function(n_clicks) {